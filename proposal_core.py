@@ -0,0 +1,186 @@
+from functools import lru_cache
+from docx import Document
+import re
+from io import BytesIO
+from spellchecker import SpellChecker
+
+# --- Constants ---
+# (display name, lowercase phrases any of which marks the section as present)
+STANDARD_SECTIONS = [
+    ("Table of content", ["table of content"]),
+    ("Introduction", ["introduction"]),
+    ("Background", ["background"]),
+    ("Objective", ["objective"]),
+    ("Methodology/Approach", ["methodology", "approach"]),
+    ("Project Team", ["project team"]),
+    ("About Sahel", ["about sahel"]),
+    ("Budget", ["budget"]),
+    ("Work Plan", ["work plan"]),
+]
+
+WORD_RE = re.compile(r'\b\w+\b')
+
+# --- Helpers ---
+@lru_cache(maxsize=None)
+def get_spell():
+    # Load the spell checker dictionary once per process
+    return SpellChecker()
+
+@lru_cache(maxsize=None)
+def get_known_words():
+    # Frozen set of dictionary words for fast set-difference lookups
+    return frozenset(get_spell().word_frequency.dictionary.keys())
+
+@lru_cache(maxsize=None)
+def get_max_word_length():
+    # SpellChecker.unknown() never flags tokens longer than this
+    return get_spell().word_frequency.longest_word_length + 3
+
+def load_proposal(data):
+    # Parse the upload once; the uploader already restricts files to .docx
+    return Document(BytesIO(data))
+
+def evaluate_proposal(required_sections, doc):
+    # Walk the document paragraphs once and reuse them for every check
+    paragraphs = doc.paragraphs
+    para_texts = [para.text for para in paragraphs]
+    # Paragraphs are newline-separated and section names never span lines,
+    # so one scan of the joined text per section matches the per-paragraph check
+    doc_lower = "\n".join(para_texts).lower()
+
+    # Section Presence Check (search for key phrases)
+    section_results = {}
+    for sec, aliases in required_sections:
+        section_results[sec] = any(alias in doc_lower for alias in aliases)
+
+    section_score = sum(section_results.values())
+    section_percentage = (section_score / len(required_sections)) * 100
+
+    # Formatting & Presentation Check
+    formatting_results = formatting_check(paragraphs, doc_lower)
+
+    # Total score calculation considering all criteria
+    total_score = 0
+    max_score = 4  # 4 main evaluation criteria: sections, font, font size, spelling issues
+
+    # Section presence is 50% of the overall score
+    total_score += section_percentage * 0.50
+
+    # Spelling issues check is 25% of the overall score
+    spelling_score = 0
+    if len(formatting_results['spelling_issues']) == 0:
+        spelling_score = 100
+    else:
+        spelling_score = max(0, 100 - len(formatting_results['spelling_issues']) * 10)
+    total_score += spelling_score * 0.25
+
+    # Font style and size check is 25% of the overall score
+    font_style_score = 100 if formatting_results['font_ok'] else 0
+    font_size_score = 100 if formatting_results['font_size_ok'] else 0
+    total_score += (font_style_score + font_size_score) * 0.25
+
+    # Round the total score to the nearest whole number
+    total_score = round(total_score)
+
+    # Recommendations
+    missing_sections = [sec for sec, present in section_results.items() if not present]
+    recommendations = []
+    if missing_sections:
+        recommendations.append(f"Kindly include the following missing sections: {', '.join(missing_sections)}")
+
+    if formatting_results['spelling_issues']:
+        recommendations.append("Spelling issues found in the document.")
+
+    if not formatting_results['font_ok']:
+        recommendations.append("Document should use font 'Tenorite' throughout.")
+
+    if not formatting_results['font_size_ok']:
+        recommendations.append("Body text should use font size 11.")
+
+    return {
+        'sections': section_results,
+        'score': total_score,
+        'recommendations': recommendations,
+        'formatting': formatting_results
+    }
+
+def formatting_check(paragraphs, doc_lower):
+    known_words = get_known_words()
+    max_word_length = get_max_word_length()
+    # Only alphabetic words of 3 to max_word_length letters are spell-checked
+    words = {
+        word for word in (match.group(0) for match in WORD_RE.finditer(doc_lower))
+        if 2 < len(word) <= max_word_length and word.isalpha()
+    }
+    misspelled = words - known_words
+    spelling_issues = list(misspelled)[:15]  # Show up to 15 misspelled words
+
+    # Check for font style "Tenorite" and font size 11 in body text
+    font_ok = True
+    font_size_ok = True
+    for para in paragraphs:
+        # Paragraph style is resolved lazily, at most once per paragraph
+        is_heading = None
+        for run in para.runs:
+            font = run.font
+            # Ensure that the font is Tenorite in both body and heading text
+            font_name = font.name
+            if font_name and font_name.lower() != "tenorite":
+                font_ok = False
+            # Check if font size is 11 for body text (not for headings)
+            font_size = font.size
+            if font_size and font_size.pt != 11:
+                if is_heading is None:
+                    style = para.style
+                    is_heading = style is not None and style.name in ('Heading 1', 'Heading 2', 'Heading 3')
+                if not is_heading:
+                    font_size_ok = False
+
+            # Nothing left to check once both criteria have failed
+            if not font_ok and not font_size_ok:
+                break
+
+        if not font_ok and not font_size_ok:
+            break
+
+    return {
+        "spelling_issues": spelling_issues,
+        "font_ok": font_ok,
+        "font_size_ok": font_size_ok
+    }
+
+def create_word_report(evaluation):
+    doc = Document()
+    doc.add_heading("Proposal Evaluation Report", level=1)
+
+    doc.add_heading("Section Check", level=2)
+    for section, found in evaluation['sections'].items():
+        doc.add_paragraph(f"{section}: {'Present' if found else 'Missing'}")
+
+    doc.add_heading("Formatting & Presentation", level=2)
+
+    if evaluation['formatting']['spelling_issues']:
+        doc.add_paragraph("Spelling Issues Detected:")
+        doc.add_paragraph(", ".join(evaluation['formatting']['spelling_issues']))
+    else:
+        doc.add_paragraph("No major spelling issues detected.")
+
+    if evaluation['formatting']['font_ok'] and evaluation['formatting']['font_size_ok']:
+        doc.add_paragraph("Font style and size meet organizational standards (Tenorite, size 11).")
+    else:
+        doc.add_paragraph("Font style does not match standard (Tenorite) or font size is not 11 in body text.")
+
+    doc.add_heading("Overall Score", level=2)
+    doc.add_paragraph(f"{evaluation['score']}%")
+
+    doc.add_heading("Recommendations", level=2)
+    if evaluation['recommendations']:
+        for rec in evaluation['recommendations']:
+            doc.add_paragraph(f"- {rec}")
+    else:
+        doc.add_paragraph("All criteria met. Great job!")
+
+    buffer = BytesIO()
+    doc.save(buffer)
+    buffer.seek(0)
+    return buffer